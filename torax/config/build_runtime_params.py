@@ -23,6 +23,8 @@ This module also provides a method
 DynamicRuntimeParamsSlice and a corresponding geometry with consistent Ip.
 """
 import chex
+import numpy as np
+from torax.config import profile_conditions as profile_conditions_lib
 from torax.config import runtime_params_slice
 from torax.geometry import geometry
 from torax.geometry import geometry_provider as geometry_provider_lib
@@ -102,6 +104,40 @@ class DynamicRuntimeParamsSliceProvider:
       t: chex.Numeric,
   ) -> runtime_params_slice.DynamicRuntimeParamsSlice:
     """Returns a runtime_params_slice.DynamicRuntimeParamsSlice to use during time t of the sim."""
+    return self._build_slice(
+        t, profile_conditions=self._profile_conditions.build_dynamic_params(t)
+    )
+
+  def call_batch(
+      self,
+      ts: np.ndarray,
+  ) -> list[runtime_params_slice.DynamicRuntimeParamsSlice]:
+    """Returns a DynamicRuntimeParamsSlice for each time in `ts`.
+
+    This is equivalent to `[self(t) for t in ts]`, except that the profile
+    conditions are interpolated over all of `ts` at once.
+
+    Args:
+      ts: A 1D array of times.
+
+    Returns:
+      A list of DynamicRuntimeParamsSlice, one for each time in `ts`.
+    """
+    ts = np.asarray(ts)
+    profile_conditions = self._profile_conditions.build_dynamic_params_batch(
+        ts
+    )
+    return [
+        self._build_slice(t, profile_conditions=pc)
+        for t, pc in zip(ts, profile_conditions, strict=True)
+    ]
+
+  def _build_slice(
+      self,
+      t: chex.Numeric,
+      profile_conditions: profile_conditions_lib.DynamicProfileConditions,
+  ) -> runtime_params_slice.DynamicRuntimeParamsSlice:
+    """Builds the slice at time t from already built profile conditions."""
     return runtime_params_slice.DynamicRuntimeParamsSlice(
         transport=self._transport_model.build_dynamic_params(t),
         solver=self._solver.build_dynamic_params,
@@ -111,7 +147,7 @@ class DynamicRuntimeParamsSliceProvider:
             if source_config is not None
         },
         plasma_composition=self._plasma_composition.build_dynamic_params(t),
-        profile_conditions=self._profile_conditions.build_dynamic_params(t),
+        profile_conditions=profile_conditions,
         numerics=self._numerics.build_dynamic_params(t),
         neoclassical=self._neoclassical.build_dynamic_params(),
         pedestal=self._pedestal.build_dynamic_params(t),
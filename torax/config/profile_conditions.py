@@ -13,9 +13,12 @@
 # limitations under the License.
 
 """Profile condition parameters used throughout TORAX simulations."""
+from collections.abc import Mapping
 import dataclasses
+from typing import Any
 
 import chex
+import numpy as np
 import pydantic
 from torax import array_typing
 from torax.torax_pydantic import torax_pydantic
@@ -174,11 +177,48 @@ class ProfileConditions(torax_pydantic.BaseModelFrozen):
       t: chex.Numeric,
   ) -> DynamicProfileConditions:
     """Builds a DynamicProfileConditions."""
+    return self._build_dynamic_params(t, precomputed={})
+
+  def build_dynamic_params_batch(
+      self,
+      ts: np.ndarray,
+  ) -> list[DynamicProfileConditions]:
+    """Builds a DynamicProfileConditions for each time in `ts`.
+
+    All time-varying scalars are interpolated over the full `ts` array in a
+    single NumPy call each, rather than once per time.
+
+    Args:
+      ts: A 1D array of times.
+
+    Returns:
+      A list of DynamicProfileConditions, one for each time in `ts`.
+    """
+    ts = np.asarray(ts)
+    batched = {
+        x.name: getattr(self, x.name).get_value(ts)
+        for x in dataclasses.fields(DynamicProfileConditions)
+        if isinstance(getattr(self, x.name), torax_pydantic.TimeVaryingScalar)
+    }
+    return [
+        self._build_dynamic_params(
+            t, precomputed={k: v[i] for k, v in batched.items()}
+        )
+        for i, t in enumerate(ts)
+    ]
+
+  def _build_dynamic_params(
+      self,
+      t: chex.Numeric,
+      precomputed: Mapping[str, Any],
+  ) -> DynamicProfileConditions:
+    """Builds a DynamicProfileConditions, reusing any precomputed values."""
 
     dynamic_params = {
         x.name: getattr(self, x.name)
         for x in dataclasses.fields(DynamicProfileConditions)
     }
+    dynamic_params.update(precomputed)
 
     if self.T_e_right_bc is None:
       dynamic_params['T_e_right_bc'] = self.T_e.get_value(
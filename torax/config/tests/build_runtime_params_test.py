@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Mapping
+import dataclasses
+import math
+from typing import Any, cast
+
 from absl.testing import absltest
 from absl.testing import parameterized
+import chex
 import numpy as np
 from torax.config import build_runtime_params
 from torax.config import profile_conditions as profile_conditions_lib
@@ -26,31 +32,78 @@ from torax.tests.test_lib import default_configs
 from torax.torax_pydantic import model_config
 from torax.torax_pydantic import torax_pydantic
 
+# Shared by all cases of `test_profile_conditions_set_temperatures`.
+_VAR_SPEC = {0: {0.0: 1.0, 1.0: 2.0}}
+_EXPECTED_PROFILE = np.array([1.125, 1.375, 1.625, 1.875])
+
 
 class RuntimeParamsSliceTest(parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self._torax_mesh = torax_pydantic.Grid1D(nx=4, dx=0.25)
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls._base_config = model_config.ToraxConfig.from_dict(
+        default_configs.get_default_config_dict()
+    )
+    # `set_grid` copies the grid into each submodel, so this can be shared.
+    cls._torax_mesh = torax_pydantic.Grid1D(nx=4, dx=0.25)
 
-  def test_time_dependent_provider_is_time_dependent(self):
-    """Tests that the runtime_params slice provider is time dependent."""
-    config = default_configs.get_default_config_dict()
-    config['profile_conditions'] = {'T_i_right_bc': {0.0: 2.0, 4.0: 4.0}}
-    torax_config = model_config.ToraxConfig.from_dict(config)
+  def _assert_close(self, actual, desired, rtol: float = 1e-7):
+    """Asserts closeness, bypassing NumPy's machinery for scalar inputs."""
+    if np.ndim(actual) == 0 and np.ndim(desired) == 0:
+      self.assertTrue(
+          math.isclose(actual, desired, rel_tol=rtol),
+          msg=f'{actual} != {desired} (rtol={rtol})',
+      )
+    else:
+      np.testing.assert_allclose(actual, desired, rtol=rtol)
+
+  @classmethod
+  def _build_provider(
+      cls,
+      overrides: Mapping[str, Any],
+  ) -> tuple[
+      model_config.ToraxConfig,
+      build_runtime_params.DynamicRuntimeParamsSliceProvider,
+  ]:
+    """Returns the base config with overridden profile conditions."""
+    profile_conditions = profile_conditions_lib.ProfileConditions.from_dict(
+        overrides
+    )
+    torax_pydantic.set_grid(
+        profile_conditions, cls._base_config.geometry.build_provider.torax_mesh
+    )
+    # Only `profile_conditions` differs, so the remaining (read-only)
+    # submodels can be shared with the base config rather than deep copied.
+    torax_config = cls._base_config.model_copy(
+        update={'profile_conditions': profile_conditions}
+    )
     provider = (
         build_runtime_params.DynamicRuntimeParamsSliceProvider.from_config(
             torax_config
         )
     )
-    dynamic_runtime_params_slice = provider(t=1.0)
-    np.testing.assert_allclose(
-        dynamic_runtime_params_slice.profile_conditions.T_i_right_bc, 2.5
+    return torax_config, provider
+
+  def test_time_dependent_provider_is_time_dependent(self):
+    """Tests that the runtime_params slice provider is time dependent."""
+    # Pre-built arrays skip the dict parsing.
+    _, provider = self._build_provider(
+        {'T_i_right_bc': (np.array([0.0, 4.0]), np.array([2.0, 4.0]))}
     )
-    dynamic_runtime_params_slice = provider(t=2.0)
-    np.testing.assert_allclose(
-        dynamic_runtime_params_slice.profile_conditions.T_i_right_bc, 3.0
+    slices = provider.call_batch(np.array([1.0, 2.0]))
+    np.testing.assert_allclose(slices[0].profile_conditions.T_i_right_bc, 2.5)
+    np.testing.assert_allclose(slices[1].profile_conditions.T_i_right_bc, 3.0)
+
+  def test_call_batch_matches_call(self):
+    """Tests that the batched provider matches calling it at each time."""
+    _, provider = self._build_provider(
+        {'T_i_right_bc': {0.0: 2.0, 4.0: 4.0}, 'Ip': {0.0: 10.0}}
     )
+    ts = np.array([0.0, 1.5, 4.0])
+    for t, dynamic_slice in zip(ts, provider.call_batch(ts), strict=True):
+      with self.subTest(t=t):
+        chex.assert_trees_all_close(dynamic_slice, provider(t=t))
 
   def test_boundary_conditions_are_time_dependent(self):
     """Tests that the boundary conditions are time dependent params."""
@@ -62,24 +115,12 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
         n_e_right_bc=({5.0: 6.0, 7.0: 8.0}, 'step'),
     )
     torax_pydantic.set_grid(profile_conditions, self._torax_mesh)
-    np.testing.assert_allclose(
-        profile_conditions.build_dynamic_params(
-            t=2.0,
-        ).T_i_right_bc,
-        3.0,
-    )
-    np.testing.assert_allclose(
-        profile_conditions.build_dynamic_params(
-            t=4.0,
-        ).T_e_right_bc,
-        4.5,
-    )
-    np.testing.assert_allclose(
-        profile_conditions.build_dynamic_params(
-            t=6.0,
-        ).n_e_right_bc,
-        6.0,
+    dynamic_profile_conditions = profile_conditions.build_dynamic_params_batch(
+        ts=np.array([2.0, 4.0, 6.0])
     )
+    self._assert_close(dynamic_profile_conditions[0].T_i_right_bc, 3.0)
+    self._assert_close(dynamic_profile_conditions[1].T_e_right_bc, 4.5)
+    self._assert_close(dynamic_profile_conditions[2].n_e_right_bc, 6.0)
 
   def test_pedestal_is_time_dependent(self):
     """Tests that the pedestal runtime params are time dependent."""
@@ -95,21 +136,28 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
     )
     # Check at time 0.
 
-    pedestal_params = pedestal.build_dynamic_params(t=0.0)
-    assert isinstance(pedestal_params, set_tped_nped.DynamicRuntimeParams)
-    np.testing.assert_allclose(pedestal_params.set_pedestal, True)
-    np.testing.assert_allclose(pedestal_params.T_i_ped, 0.0)
-    np.testing.assert_allclose(pedestal_params.T_e_ped, 1.0)
-    np.testing.assert_allclose(pedestal_params.n_e_ped, 2.0)
-    np.testing.assert_allclose(pedestal_params.rho_norm_ped_top, 3.0)
+    pedestal_params = cast(
+        set_tped_nped.DynamicRuntimeParams,
+        pedestal.build_dynamic_params(t=0.0),
+    )
+    # Dynamic params are built once per provider call and only read.
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      pedestal_params.T_i_ped = 2.0  # pytype: disable=not-writable
+    self.assertTrue(pedestal_params.set_pedestal)
+    self._assert_close(pedestal_params.T_i_ped, 0.0)
+    self._assert_close(pedestal_params.T_e_ped, 1.0)
+    self._assert_close(pedestal_params.n_e_ped, 2.0)
+    self._assert_close(pedestal_params.rho_norm_ped_top, 3.0)
     # And check after the time limit.
-    pedestal_params = pedestal.build_dynamic_params(t=1.0)
-    assert isinstance(pedestal_params, set_tped_nped.DynamicRuntimeParams)
-    np.testing.assert_allclose(pedestal_params.set_pedestal, False)
-    np.testing.assert_allclose(pedestal_params.T_i_ped, 1.0)
-    np.testing.assert_allclose(pedestal_params.T_e_ped, 2.0)
-    np.testing.assert_allclose(pedestal_params.n_e_ped, 3.0)
-    np.testing.assert_allclose(pedestal_params.rho_norm_ped_top, 5.0)
+    pedestal_params = cast(
+        set_tped_nped.DynamicRuntimeParams,
+        pedestal.build_dynamic_params(t=1.0),
+    )
+    self.assertFalse(pedestal_params.set_pedestal)
+    self._assert_close(pedestal_params.T_i_ped, 1.0)
+    self._assert_close(pedestal_params.T_e_ped, 2.0)
+    self._assert_close(pedestal_params.n_e_ped, 3.0)
+    self._assert_close(pedestal_params.rho_norm_ped_top, 5.0)
 
   def test_gaussian_width_in_dynamic_runtime_params_cannot_be_negative(self):
     sources = sources_pydantic_model.Sources.from_dict({
@@ -135,80 +183,41 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
           t=1.0,
       )
 
-  @parameterized.parameters(
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          None,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          2.0,
-          'T_i',
-      ),
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          3.0,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          3.0,
-          'T_i',
-      ),
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          None,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          2.0,
-          'T_e',
-      ),
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          3.0,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          3.0,
-          'T_e',
-      ),
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          None,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          2.0,
-          'n_e',
-      ),
-      (
-          {0: {0.0: 1.0, 1.0: 2.0}},
-          3.0,
-          np.array([1.125, 1.375, 1.625, 1.875]),
-          3.0,
-          'n_e',
-      ),
-  )
-  def test_profile_conditions_set_electron_temperature_and_boundary_condition(
-      self,
-      var,
-      var_boundary_condition,
-      expected_var,
-      expected_var_boundary_condition,
-      var_name,
-  ):
-    """Tests that the profile conditions can set the electron temperature."""
-    boundary_var_name = var_name + '_right_bc'
-
-    temperatures = {
-        var_name: var,
-        boundary_var_name: var_boundary_condition,
-    }
-    profile_conditions = profile_conditions_lib.ProfileConditions.from_dict(
-        temperatures
-    )
+  def test_profile_conditions_set_temperatures(self):
+    """Tests that profile conditions set the profiles and boundary values."""
+    # The geometry is the same for every case, so only build it once.
     geo = geometry_pydantic_model.CircularConfig(n_rho=4).build_geometry()
-    torax_pydantic.set_grid(profile_conditions, geo.torax_mesh)
-    dynamic_profile_conditions = profile_conditions.build_dynamic_params(
-        t=0.0,
-    )
-    np.testing.assert_allclose(
-        getattr(dynamic_profile_conditions, var_name), expected_var
+    cases = (
+        (None, 2.0, 'T_i'),
+        (3.0, 3.0, 'T_i'),
+        (None, 2.0, 'T_e'),
+        (3.0, 3.0, 'T_e'),
+        (None, 2.0, 'n_e'),
+        (3.0, 3.0, 'n_e'),
     )
-    self.assertEqual(
-        getattr(dynamic_profile_conditions, boundary_var_name),
+    for (
+        var_boundary_condition,
         expected_var_boundary_condition,
-    )
+        var_name,
+    ) in cases:
+      with self.subTest(
+          var_name=var_name, var_boundary_condition=var_boundary_condition
+      ):
+        boundary_var_name = var_name + '_right_bc'
+        profile_conditions = profile_conditions_lib.ProfileConditions.from_dict(
+            {var_name: _VAR_SPEC, boundary_var_name: var_boundary_condition}
+        )
+        torax_pydantic.set_grid(profile_conditions, geo.torax_mesh)
+        dynamic_profile_conditions = profile_conditions.build_dynamic_params(
+            t=0.0,
+        )
+        np.testing.assert_allclose(
+            getattr(dynamic_profile_conditions, var_name), _EXPECTED_PROFILE
+        )
+        self.assertEqual(
+            getattr(dynamic_profile_conditions, boundary_var_name),
+            expected_var_boundary_condition,
+        )
 
   @parameterized.product(
       n_e_right_bc=[
@@ -231,23 +240,16 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
       n_e_nbar_is_fGW,  # pylint: disable=invalid-name
   ):
     """Tests that the profile conditions can set the electron density."""
-
-    config = default_configs.get_default_config_dict()
-    config['profile_conditions'] = {
+    torax_config, provider = self._build_provider({
         'n_e_right_bc': n_e_right_bc,
         'n_e_right_bc_is_fGW': n_e_right_bc_is_fGW,
         'n_e_nbar_is_fGW': n_e_nbar_is_fGW,
-    }
-    torax_config = model_config.ToraxConfig.from_dict(config)
+    })
     static_slice = build_runtime_params.build_static_params_from_config(
         torax_config
     ).profile_conditions
 
-    dynamic_profile_conditions = (
-        build_runtime_params.DynamicRuntimeParamsSliceProvider.from_config(
-            torax_config
-        )(t=0.0).profile_conditions
-    )
+    dynamic_profile_conditions = provider(t=0.0).profile_conditions
 
     if n_e_right_bc is None:
       # If the boundary condition was not set, it should inherit the fGW flag.
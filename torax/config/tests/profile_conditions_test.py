@@ -14,6 +14,8 @@
 
 from absl.testing import absltest
 from absl.testing import parameterized
+import chex
+import jax.numpy as jnp
 import numpy as np
 from torax.config import build_runtime_params
 from torax.config import config_args
@@ -34,6 +36,40 @@ class ProfileConditionsTest(parameterized.TestCase):
     torax_pydantic.set_grid(pc, geo.torax_mesh)
     pc.build_dynamic_params(t=0.0)
 
+  def test_build_dynamic_params_batch_matches_build_dynamic_params(self):
+    pc = profile_conditions.ProfileConditions(
+        Ip={0.0: 10.0, 2.0: 12.0},
+        T_i_right_bc={0.0: 2.0, 4.0: 4.0},
+        n_e_right_bc=({1.0: 0.5, 3.0: 0.7}, 'step'),
+        T_e={0: {0: 1.0, 1: 2.0}, 1.5: {0: 100.0, 1: 200.0}},
+    )
+    geo = geometry_pydantic_model.CircularConfig().build_geometry()
+    torax_pydantic.set_grid(pc, geo.torax_mesh)
+    ts = np.array([0.0, 1.0, 1.5, 3.0, 5.0])
+    batch = pc.build_dynamic_params_batch(ts)
+    self.assertLen(batch, len(ts))
+    for t, dcs in zip(ts, batch):
+      with self.subTest(t=t):
+        chex.assert_trees_all_close(dcs, pc.build_dynamic_params(t=t))
+
+  def test_build_dynamic_params_numpy_time_matches_jax_time(self):
+    """NumPy interpolation of scalars matches the JAX path."""
+    pc = profile_conditions.ProfileConditions(
+        Ip={0.0: 10.0, 2.0: 12.0},
+        vloop_lcfs=({0.0: 0.1, 2.0: 0.3}, 'step'),
+        T_i_right_bc={0.0: 2.0, 4.0: 4.0},
+        nbar={0.0: 0.8, 1.0: 0.9, 3.0: 0.7},
+    )
+    geo = geometry_pydantic_model.CircularConfig().build_geometry()
+    torax_pydantic.set_grid(pc, geo.torax_mesh)
+    for t in [0.0, 1.0, 2.5, 5.0]:
+      with self.subTest(t=t):
+        chex.assert_trees_all_close(
+            pc.build_dynamic_params(t=t),
+            pc.build_dynamic_params(t=jnp.array(t)),
+            rtol=1e-6,
+        )
+
   @parameterized.named_parameters(
       ('no boundary condition', None, 2.0, 200.0),
       ('boundary condition provided', 3.0, 3.0, 3.0),
@@ -23,11 +23,13 @@ from torax.torax_pydantic import model_config
 
 class RuntimeParamsSliceTest(parameterized.TestCase):
 
-  def setUp(self):
-    super().setUp()
-    self._torax_config = model_config.ToraxConfig.from_dict(
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # The default config is only read by these tests, so build it once.
+    cls._torax_config = model_config.ToraxConfig.from_dict(
         default_configs.get_default_config_dict())
-    self._torax_mesh = self._torax_config.geometry.build_provider.torax_mesh
+    cls._torax_mesh = cls._torax_config.geometry.build_provider.torax_mesh
 
   def test_dynamic_slice_can_be_input_to_jitted_function(self):
     """Tests that the slice can be input to a jitted function."""
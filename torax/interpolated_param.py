@@ -234,7 +234,14 @@ class StepInterpolatedParam(InterpolatedParamBase):
       self,
       x: chex.Numeric,
   ) -> chex.Array:
-    return step_interpolate(self._padded_xs, self._padded_ys, x)
+    # This function can be used inside a JITted function, where x are
+    # tracers. Thus are required to use the JAX version in this case.
+    if isinstance(x, jax.Array):
+      return step_interpolate(self._padded_xs, self._padded_ys, x)
+    # Matches `step_interpolate`, which takes the value of the last knot
+    # strictly less than x.
+    idx = np.searchsorted(self.xs, x, side='left') - 1
+    return self.ys[np.maximum(idx, 0)]
 
 
 def _is_bool(
@@ -409,7 +416,9 @@ class InterpolatedVarSingleAxis(InterpolatedParamBase):
     """Returns a single value for this range at the given coordinate."""
     value = self._param.get_value(x)
     if self._is_bool_param:
-      return jnp.bool_(value > 0.5)
+      if isinstance(x, jax.Array):
+        return jnp.bool_(value > 0.5)
+      return value > 0.5
     return value
 
   @property
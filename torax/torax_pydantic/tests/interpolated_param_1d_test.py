@@ -14,6 +14,7 @@
 
 from absl.testing import absltest
 from absl.testing import parameterized
+import jax.numpy as jnp
 import numpy as np
 import pydantic
 from torax import interpolated_param
@@ -73,6 +74,29 @@ class InterpolatedParam1dTest(parameterized.TestCase):
       a_expected._update_fields({'time': a_time})
       self.assertIs(a_expected.time, a_time)
 
+  @parameterized.parameters(
+      (np.array([0.0, 4.0]), np.array([2.0, 4.0])),
+      (np.array([4.0, 0.0]), np.array([4.0, 2.0])),
+  )
+  def test_array_tuple_input_matches_dict_input(self, time, value):
+    from_arrays = torax_pydantic.TimeVaryingScalar.model_validate((time, value))
+    from_dict = torax_pydantic.TimeVaryingScalar.model_validate(
+        {0.0: 2.0, 4.0: 4.0}
+    )
+    self.assertEqual(from_arrays, from_dict)
+    np.testing.assert_allclose(from_arrays.get_value(t=1.0), 2.5)
+
+  @parameterized.parameters(
+      (np.array([0.0, 4.0]), np.array([2.0, 4.0])),
+      (np.array([4.0, 0.0]), np.array([4.0, 2.0])),
+  )
+  def test_array_tuple_input_is_copied(self, time, value):
+    time, value = np.copy(time), np.copy(value)
+    scalar = torax_pydantic.TimeVaryingScalar.model_validate((time, value))
+    time[:] = 100.0
+    value[:] = 100.0
+    np.testing.assert_allclose(scalar.get_value(t=1.0), 2.5)
+
   def test_bool_single_value_param_always_return_constant(self):
     """Tests that when passed a single value this is always returned."""
     expected_output = True
@@ -190,6 +214,28 @@ class InterpolatedParam1dTest(parameterized.TestCase):
         expected_output,
     )
 
+  @parameterized.product(
+      interpolation_mode=['piecewise_linear', 'step'],
+      is_bool_param=[True, False],
+  )
+  def test_numpy_get_value_matches_jax_get_value(
+      self, interpolation_mode, is_bool_param
+  ):
+    if is_bool_param:
+      values = {0.0: False, 1.0: True, 2.0: False}
+    else:
+      values = {0.0: 1.0, 1.0: 3.0, 2.0: -2.0}
+    scalar = torax_pydantic.TimeVaryingScalar.model_validate(
+        (values, interpolation_mode)
+    )
+    for t in [-1.0, 0.0, 0.5, 1.0, 1.5, 2.0, 3.0]:
+      with self.subTest(t=t):
+        np.testing.assert_allclose(
+            scalar.get_value(t=t),
+            scalar.get_value(t=jnp.array(t)),
+            rtol=1e-6,
+        )
+
   def test_test_equality_cached_property(self):
     scalar_1 = torax_pydantic.TimeVaryingScalar.model_validate(1.0)
     scalar_2 = torax_pydantic.TimeVaryingScalar.model_validate(1.0)